@@ -5,6 +5,8 @@ import pandas as pd
 from subprocess import check_output
 import subprocess as subp
 import cpu_info as cpu_i
+import perf_profile as perf_p
+import spool as spool_q
 import hashlib
 from datetime import datetime
 import sys
@@ -28,6 +30,15 @@ libs = ['fastad', 'stan', 'adept', 'baseline', 'cppad', 'sacado']
 tests = ['regression', 'log_sum_exp', 'matrix_product', 'normal_log_pdf', 'prod', 'prod_iter',
           'stochastic_volatility', 'sum', 'sum_iter']
 
+# Jacobian benchmarks: vector-valued functions timed over (N inputs, M outputs)
+jacobian_tests = ['jacobian_log_sum_exp', 'jacobian_matrix_product', 'jacobian_normal_log_pdf']
+
+# ADOL-C only runs the Jacobian benchmarks
+jacobian_libs = libs + ['adolc']
+
+# Input sizes of the Jacobian benchmarks (CreateRange(1, 1 << 8, 4) in the drivers)
+jacobian_sizes = [1, 4, 16, 64, 256]
+
 # Make plot font size bigger
 plt.rcParams["font.size"] = "12"
 
@@ -40,6 +51,21 @@ def lib_path(libname):
 def bin_name(libname, testname):
     return ''.join([libname, '_', testname])
 
+# Libraries that run a test
+def test_libs(testname):
+    return jacobian_libs if testname in jacobian_tests else libs
+
+# Modes of the Jacobian drivers (the baseline has none)
+jacobian_modes = ['forward', 'reverse', 'vector_forward', 'vector_reverse']
+
+# Regex selecting the benchmarks of input size N in a binary,
+# narrowed to M outputs and one mode for the Jacobian tests
+def bench_filter(testname, N, M=None, mode=None):
+    if testname in jacobian_tests:
+        prefix = "_jacobian_" + mode + "<.*>" if mode else ""
+        return prefix + "/N:" + str(N) + "/M:" + (str(M) if M else "[0-9]+") + "$"
+    return "/" + str(N) + "$"
+
 # Plot result of test
 def plot_test(df, name):
     axes = df.plot(x='N',
@@ -55,6 +81,68 @@ def plot_test(df, name):
     plt.savefig(os.path.join(figpath, name + '_fig.png'))
 
 
+# Read google benchmark csv output, skipping the context lines before the header.
+# Returns None if the run matched no benchmark (no header).
+def read_benchmark_csv(path):
+    with open(path, "r") as f:
+        lines = f.read().splitlines()
+    start = next((i for i, line in enumerate(lines) if line.startswith("name,")), None)
+    if start is None:
+        print("No benchmark results in", path, "skipping")
+        return None
+    return pd.read_csv(io.StringIO("\n".join(lines[start:])))
+
+# Mean cpu time per (lib, mode, N, M) of a Jacobian benchmark csv
+def jacobian_times(df):
+    df = df[~df['name'].str.contains('_mean|_median|_stddev|_cv')]
+    parsed = df['name'].str.extract(r'^BM_([a-z]+)_jacobian_?(\w*)<')
+    df = df.assign(lib=parsed[0], mode=parsed[1].replace('', 'value'))
+    return df.groupby(['lib', 'mode', 'N', 'M'], as_index=False)['cpu_time'].mean()
+
+# Compare the best forward mode against the best reverse mode for each backend.
+# Saves <test>_crossover.csv in the run folder and one panel per backend of
+# forward/reverse time against M, one line per N; the crossover is where a line crosses 1.
+def plot_jacobian(testname, results_path):
+    frames = []
+    for lib in jacobian_libs:
+        data_path = os.path.join(results_path, testname + "_" + lib + "_multirun.csv")
+        df = read_benchmark_csv(data_path) if os.path.exists(data_path) else None
+        if df is not None:
+            frames.append(jacobian_times(df))
+    if not frames:
+        return None
+    times = pd.concat(frames)
+    forward = times[times['mode'].str.endswith('forward')].groupby(['lib', 'N', 'M'])['cpu_time'].min()
+    reverse = times[times['mode'].str.endswith('reverse')].groupby(['lib', 'N', 'M'])['cpu_time'].min()
+    cross = pd.concat({'forward': forward, 'reverse': reverse}, axis=1).dropna().reset_index()
+    if cross.empty:
+        print("No backend with both forward and reverse results for", testname)
+        return None
+    cross['forward_over_reverse'] = cross['forward'] / cross['reverse']
+    cross.to_csv(os.path.join(results_path, testname + "_crossover.csv"), index=False)
+
+    cross_libs = sorted(cross['lib'].unique())
+    fig, axes = plt.subplots(1, len(cross_libs), sharey=True, squeeze=False,
+                             figsize=(4 * len(cross_libs), 4))
+    for ax, lib in zip(axes[0], cross_libs):
+        for N, line in cross[cross['lib'] == lib].groupby('N'):
+            ax.plot(line['M'], line['forward_over_reverse'], marker='.', label='N=' + str(N))
+        ax.axhline(1, color='grey', linestyle='--')
+        ax.set_xscale('log', base=2)
+        ax.set_yscale('log', base=2)
+        ax.set_title(lib)
+        ax.set_xlabel('M (outputs)')
+    axes[0][0].set_ylabel('Forward Time / Reverse Time')
+    axes[0][-1].legend()
+    fig.suptitle(testname)
+    fig.tight_layout()
+    run_figpath = os.path.join(figpath, "figs_" + os.path.basename(os.path.normpath(results_path)))
+    if not os.path.exists(run_figpath):
+        os.makedirs(run_figpath)
+    fig.savefig(os.path.join(run_figpath, testname + "_crossover.png"))
+    plt.close(fig)
+    return cross
+
 def is_numactl_available():
     """
     Checks if the 'numactl' command is available in the system's PATH.
@@ -64,26 +152,105 @@ def is_numactl_available():
     """
     return shutil.which("numactl") is not None
 
+# Command prefix that pins the benchmark to the requested cores
+def exec_prefix(args):
+    if is_numactl_available():
+        return ["numactl", "--physcpubind=" + args.cpu, "--membind=" + args.membind]
+    return []
+
 # Run test for each library
 def run(testname, results_path, args):
     # run test for each lib and save times
     print("---------\n", testname, "\n---------")
-    for lib in libs:
+    for lib in test_libs(testname):
         print("___________\n", lib, "\n___________")
         # change directory to library
         # some libraries may require this to read configuration file
         path = os.path.join(lib_path(lib), lib + "_" + testname)
         # run and get output from each
         data_path = os.path.join(results_path, str(testname + "_" + lib + "_multirun.csv"))
-        if is_numactl_available():
-           base_exec = ["numactl", "--physcpubind=" + args.cpu, "--membind=" + args.membind]
-        else:
-           base_exec = []
-        exec_str = base_exec + [path, "--benchmark_out_format=csv", "--benchmark_format=csv", "--benchmark_repetitions=30", "--benchmark_enable_random_interleaving=true ", "--benchmark_out=" + data_path]
+        exec_str = exec_prefix(args) + [path, "--benchmark_out_format=csv", "--benchmark_format=csv", "--benchmark_repetitions=30", "--benchmark_enable_random_interleaving=true ", "--benchmark_out=" + data_path]
         print("Running: ", ' '.join(exec_str))
         subp.run(exec_str, check=True)
     return None
 
+# Names of the benchmarks in a binary that match a --benchmark_filter regex
+def list_benchmarks(path, filt):
+    out = subp.run([path, "--benchmark_list_tests=true", "--benchmark_filter=" + filt],
+                   capture_output=True, text=True)
+    return out.stdout.split()
+
+# Profile selected (lib, test, N) points with perf and store reports in the run folder
+def profile(results_path, args):
+    if not perf_p.is_perf_available():
+        print("perf not found, skipping profiling of:",
+              ' '.join(':'.join(str(x) for x in p if x is not None) for p in args.profile))
+        return None
+    for lib, testname, N, M, mode in args.profile:
+        point = [str(x) for x in (N, M, mode) if x is not None]
+        print("---------\n", "profiling", lib, testname, ' '.join(point), "\n---------")
+        path = os.path.join(lib_path(lib), bin_name(lib, testname))
+        out_dir = os.path.join(results_path, "profile", '_'.join([bin_name(lib, testname)] + point))
+        _, cats = perf_p.profile_point(path, lib, testname, N, out_dir,
+                                       bench_filter=bench_filter(testname, N, M, mode),
+                                       exec_prefix=exec_prefix(args),
+                                       min_time=args.profile_min_time,
+                                       call_graph=args.profile_call_graph,
+                                       top=args.profile_top)
+        for row in cats:
+            print(f"  {row['category']:<12} {row['pct']:6.2f}%")
+    return None
+
+# Run a single (lib, test, N, config) job from the spool, writing its csv to out_file
+def run_job(job, out_file, args):
+    lib, testname, N = job["lib"], job["test"], job["N"]
+    path = os.path.join(lib_path(lib), bin_name(lib, testname))
+    exec_str = exec_prefix(args) + [path, "--benchmark_filter=" + bench_filter(testname, N),
+                                    "--benchmark_out_format=csv", "--benchmark_format=csv",
+                                    "--benchmark_repetitions=" + str(job["config"]["repetitions"]),
+                                    "--benchmark_enable_random_interleaving=true",
+                                    "--benchmark_out=" + out_file]
+    print("Running: ", ' '.join(exec_str))
+    subp.run(exec_str, check=True)
+
+# Distributed sweep through a shared spool directory
+def run_spool(text, args):
+    if args.spool_role == "submit":
+        config = {"name": args.config_name, "repetitions": args.repetitions}
+        sizes = [int(n) for n in args.sizes.split(",")] if args.sizes else None
+        submit_tests = args.tests.split(",")
+        n_new = 0
+        for group, group_libs, default_sizes in ((tests, libs, spool_q.DEFAULT_SIZES),
+                                                 (jacobian_tests, jacobian_libs, jacobian_sizes)):
+            group_tests = [t for t in submit_tests if t in group]
+            submit_libs = [l for l in args.libs.split(",") if l in group_libs] if args.libs else group_libs
+            submit_sizes = sizes or default_sizes
+            if group is jacobian_tests and sizes:
+                # the Jacobian drivers only register jacobian_sizes, other N match no benchmark
+                submit_sizes = [n for n in sizes if n in jacobian_sizes]
+                skipped = [n for n in sizes if n not in jacobian_sizes]
+                if group_tests and skipped:
+                    print("Skipping sizes not registered by the Jacobian tests:", skipped)
+            n_new += spool_q.submit(args.spool, submit_libs, group_tests, submit_sizes, config)
+        print("Submitted", n_new, "new jobs to", args.spool)
+    elif args.spool_role == "work":
+        fp = cpu_i.fingerprint()
+        spool_q.register_host(args.spool, fp, text)
+        print("Worker for hardware", fp, "pinned to cpu", args.cpu)
+        n_done = spool_q.work(args.spool, fp, lambda job, out_file: run_job(job, out_file, args),
+                              worker_id=args.worker_id, lease=args.lease)
+        print("Finished", n_done, "jobs")
+    elif args.spool_role == "status":
+        for fp, counts in spool_q.status(args.spool).items():
+            print(fp, ', '.join(k + "=" + str(v) for k, v in counts.items()))
+    elif args.spool_role == "collect":
+        stamp = datetime.now().strftime("%Y_%m_%d_H%H_M%M_S%S")
+        for run_dir in spool_q.collect(args.spool, args.results_path, stamp):
+            print("Wrote", run_dir)
+            for test in jacobian_tests:
+                plot_jacobian(test, run_dir)
+    return None
+
 def parse_args():
     import argparse
     ap = argparse.ArgumentParser(description="Generate a human-readable benchmark system report (Linux).")
@@ -94,7 +261,44 @@ def parse_args():
     ap.add_argument("--membind", default=str(0), help="If numactl available, integer of NUMA node CPU is on (default: %(default)s).")
     ap.add_argument("--results-path", default=datapath, help="Path to save results (default: %(default)s).")
     ap.add_argument("--file_base", default="", help="Base name for output files (default: hash of cpu info + datetime). ")
-    return ap.parse_args()
+    ap.add_argument("--profile", action="append", default=[], metavar="LIB:TEST:N[:M[:MODE]]", type=perf_p.parse_point,
+                    help="Profile this point with perf after the sweep, e.g. adept:prod_iter:1024 or "
+                         "adept:jacobian_matrix_product:16:64:reverse (repeatable).")
+    ap.add_argument("--profile-only", action="store_true", help="Skip the timing sweep and only run --profile points.")
+    ap.add_argument("--run-dir", default="", help="Existing run folder in docs/data to store --profile-only results in (default: a new folder).")
+    ap.add_argument("--profile-min-time", type=float, default=5.0, help="Seconds to run each profiled point (default: %(default)s).")
+    ap.add_argument("--profile-call-graph", default="dwarf", help="perf record --call-graph mode: dwarf, fp or lbr (default: %(default)s).")
+    ap.add_argument("--profile-top", type=int, default=25, help="Number of rows in the hot-function table (default: %(default)s).")
+    ap.add_argument("--spool", default="", help="Shared spool directory for a distributed sweep (default: run locally).")
+    ap.add_argument("--spool-role", choices=["submit", "work", "status", "collect"], default="work",
+                    help="submit the job matrix, work on it, print its status or collect results into --results-path (default: %(default)s).")
+    ap.add_argument("--libs", default="", help="Comma-separated libraries to submit (default: " + ','.join(libs) + "; adolc is added for Jacobian tests).")
+    ap.add_argument("--tests", default=','.join(tests + jacobian_tests), help="Comma-separated tests to submit (default: %(default)s).")
+    ap.add_argument("--sizes", default="", help="Comma-separated N to submit (default: 1, 2, ..., 16384; "
+                                                "Jacobian tests only take sizes in 1, 4, ..., 256).")
+    ap.add_argument("--config-name", default="default", help="Name of the submitted configuration (default: %(default)s).")
+    ap.add_argument("--repetitions", type=int, default=30, help="Benchmark repetitions of submitted jobs (default: %(default)s).")
+    ap.add_argument("--lease", type=float, default=spool_q.DEFAULT_LEASE, help="Seconds without heartbeat before a claimed job is retried (default: %(default)s).")
+    ap.add_argument("--worker-id", default=None, help="Name of this worker (default: hostname-pid).")
+    args = ap.parse_args()
+    if args.run_dir and not (args.profile_only and os.path.isdir(args.run_dir)):
+        ap.error("--run-dir must be an existing run folder and is only used with --profile-only")
+    # fail before the sweep rather than after it
+    for lib, testname, N, M, mode in args.profile:
+        spec = ':'.join(str(x) for x in (lib, testname, N, M, mode) if x is not None)
+        if testname not in tests + jacobian_tests or lib not in test_libs(testname):
+            ap.error("unknown profile point " + spec)
+        if (M is not None or mode is not None) and testname not in jacobian_tests:
+            ap.error("M and MODE only apply to Jacobian tests: " + spec)
+        if mode is not None and mode not in jacobian_modes:
+            ap.error("unknown Jacobian mode in " + spec + " (one of " + ', '.join(jacobian_modes) + ")")
+        path = os.path.join(lib_path(lib), bin_name(lib, testname))
+        if not os.path.exists(path):
+            ap.error("no benchmark binary for profile point " + spec)
+        # e.g. an N outside the swept range or a mode the library does not have
+        if not list_benchmarks(path, bench_filter(testname, N, M, mode)):
+            ap.error("profile point " + spec + " matches no benchmark in " + path)
+    return args
 
 # For each test, run and plot
 
@@ -108,6 +312,13 @@ def main():
   if (base_file_name == ""):
       base_file_name = hashlib.sha256(encoded_text).hexdigest()
   print(text)
+  if args.spool:
+    run_spool(text, args)
+    return None
+  if args.run_dir:
+    # profile into the run that showed the anomaly
+    profile(args.run_dir, args)
+    return None
   formatted_datetime = datetime.now().strftime("%Y_%m_%d_H%H_M%M_S%S")
   multi_path = os.path.join(datapath, "benchmarks" + formatted_datetime + "_" + base_file_name)
   # Make multi path folder if does not exist
@@ -116,8 +327,13 @@ def main():
   # Write text to readme.md in multi_path
   with open(os.path.join(multi_path, "README.md"), "w") as f:
       f.write(text)
-  for test in tests:
-    run(test, multi_path, args)
+  if not args.profile_only:
+    for test in tests + jacobian_tests:
+      run(test, multi_path, args)
+    for test in jacobian_tests:
+      plot_jacobian(test, multi_path)
+  if args.profile:
+    profile(multi_path, args)
 
 if __name__ == "__main__":
     main()
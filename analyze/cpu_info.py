@@ -14,6 +14,7 @@ Features (best effort, degrades gracefully):
 - Extras: cpufreq driver, scaling info
 """
 
+import hashlib
 import json
 import os
 import re
@@ -342,6 +343,28 @@ def parse_flags(flags):
     present = [name for flg,name in key.items() if flg in flags]
     return present
 
+def fingerprint():
+    """
+    Short hash identifying the hardware generation of this host.
+    Only stable properties are used (no current clocks, load or free memory),
+    so every host of the same generation and configuration gets the same value.
+    """
+    lscpu = parse_lscpu()
+    pinfo = proc_cpuinfo()
+    freq = cpufreq_info()
+    key = {
+        "model": lscpu.get("Model name") or pinfo.get("model_name"),
+        "arch": lscpu.get("Architecture") or uname_info().get("machine"),
+        "sockets": lscpu.get("Socket(s)") or pinfo.get("sockets"),
+        "cores_per_socket": lscpu.get("Core(s) per socket") or pinfo.get("cores_per_socket"),
+        "threads_per_core": lscpu.get("Thread(s) per core"),
+        "logical_cpus": lscpu.get("CPU(s)"),
+        "max_freq_mhz": freq.get("max_freq_mhz"),
+        "caches": [lscpu.get(k) for k in ("L1d cache", "L1i cache", "L2 cache", "L3 cache")],
+        "simd": parse_flags(pinfo.get("flags", [])),
+    }
+    return hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
 def build_report(args):
     color = not args.no_color
     osrel = parse_os_release()
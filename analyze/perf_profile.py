@@ -0,0 +1,358 @@
+"""
+perf_profile.py — Sampling-profiler capture for single benchmark points (Linux).
+
+For a (lib, test, N) point the benchmark binary is run under `perf record`
+with call graphs, filtered to that size with `--benchmark_filter`. The samples
+are symbolized with `perf script` and turned into:
+- stacks.folded      : folded stacks (usable with flamegraph.pl / speedscope)
+- flamegraph.svg     : flame graph colored by category
+- hot_functions.csv  : top-N functions by self samples (with inclusive samples)
+- categories.csv     : self samples attributed to AD library / Eigen / functor / ...
+- README.md          : the command that was run and both tables in markdown
+"""
+
+import argparse
+import csv
+import os
+import re
+import shutil
+import subprocess as subp
+import tempfile
+from collections import defaultdict
+import matplotlib.pyplot as plt
+from matplotlib.patches import Rectangle
+
+# Symbol prefixes of each AD library's internals
+AD_LIB_PREFIXES = {
+    'adept': ('adept::',),
+    'adolc': ('adouble', 'badouble', 'adub', 'pdouble', 'ValueTape', 'StoreManager',
+              'zos_forward', 'fos_forward', 'fov_forward', 'hos_forward',
+              'fos_reverse', 'fov_reverse', 'hos_reverse', 'trace_on', 'trace_off'),
+    'cppad': ('CppAD::',),
+    'fastad': ('ad::',),
+    'sacado': ('Sacado::',),
+    'stan': ('stan::',),
+}
+# Shared objects that only contain AD library code
+AD_LIB_DSOS = {
+    'adolc': ('libadolc',),
+}
+
+CATEGORY_COLORS = {
+    'ad_library': '#d62728',
+    'eigen': '#1f77b4',
+    'functor': '#2ca02c',
+    'benchmark': '#7f7f7f',
+    'system': '#ff7f0e',
+    'other': '#bcbd22',
+}
+
+PERF_FREQ = "4999"    # sampling frequency (Hz), odd to avoid lockstep with timers
+
+def is_perf_available():
+    return shutil.which("perf") is not None
+
+def parse_point(spec):
+    """
+    Parses a profile point given as LIB:TEST:N, or LIB:TEST:N:M[:MODE] for
+    the Jacobian benchmarks (M outputs, MODE e.g. forward or vector_reverse).
+
+    Returns:
+        tuple: (lib, test, N, M, mode) with N and M as ints; M and mode may be None.
+    """
+    parts = spec.split(":")
+    if not 3 <= len(parts) <= 5 or not all(p.isdigit() for p in parts[2:4]) \
+       or not all(parts):
+        # ArgumentTypeError so argparse shows this message as is
+        raise argparse.ArgumentTypeError("profile point must look like LIB:TEST:N[:M[:MODE]], got '" + spec + "'")
+    M = int(parts[3]) if len(parts) > 3 else None
+    mode = parts[4] if len(parts) > 4 else None
+    return parts[0], parts[1], int(parts[2]), M, mode
+
+def _strip_balanced(s, open_ch, close_ch):
+    out = []
+    depth = 0
+    for ch in s:
+        if ch == open_ch:
+            depth += 1
+        elif ch == close_ch:
+            depth = max(depth - 1, 0)
+        elif depth == 0:
+            out.append(ch)
+    return ''.join(out)
+
+def qualified_name(sym):
+    """
+    Reduces a demangled symbol to its qualified name without return type,
+    template arguments or parameters, e.g.
+    'void adb::BM_adept<adb::SumFunc>(benchmark::State&)' -> 'adb::BM_adept'.
+    """
+    sym = re.sub(r"\s+const$", "", sym.strip()).replace("(anonymous namespace)", "{anonymous}")
+    # drop the parameter list (last top-level parenthesized group)
+    if sym.endswith(")"):
+        depth = 0
+        for i in range(len(sym) - 1, -1, -1):
+            if sym[i] == ")":
+                depth += 1
+            elif sym[i] == "(":
+                depth -= 1
+                if depth == 0:
+                    sym = sym[:i]
+                    break
+    sym = _strip_balanced(sym, "<", ">")
+    tokens = sym.split()
+    return tokens[-1] if tokens else sym
+
+def classify(sym, dso, lib):
+    """
+    Attributes a frame to one of the keys of CATEGORY_COLORS.
+    """
+    name = qualified_name(sym)
+    dso_base = os.path.basename(dso)
+    if name.startswith(AD_LIB_PREFIXES.get(lib, ())) or dso_base.startswith(AD_LIB_DSOS.get(lib, ())):
+        return 'ad_library'
+    if name.startswith("Eigen::"):
+        return 'eigen'
+    if name.startswith("adb::"):
+        return 'functor'
+    if name.startswith("benchmark::"):
+        return 'benchmark'
+    if dso_base.startswith(("libc.", "libc-", "libm.", "libm-", "ld-linux", "libstdc++", "libgcc")) \
+       or dso.startswith("[kernel") or dso == "[vdso]":
+        return 'system'
+    return 'other'
+
+_FRAME_RE = re.compile(r"^\s+[0-9a-fA-F]+\s+(.*)\s+\(([^()]*)\)$")
+
+def parse_perf_script(text, comm=None):
+    """
+    Parses default `perf script` output of a call-graph recording.
+    If comm is given, samples of other commands (e.g. numactl before it
+    execs the benchmark) are dropped.
+
+    Returns:
+        list: one entry per sample, each a list of (symbol, dso) from leaf to root.
+    """
+    samples = []
+    frames = None
+    for line in text.splitlines():
+        if not line.strip():
+            if frames:
+                samples.append(frames)
+            frames = None
+            continue
+        if not line[0].isspace():
+            # sample header: comm pid time: period event:
+            if frames:
+                samples.append(frames)
+            frames = [] if comm is None or line.split()[0] == comm else None
+            continue
+        m = _FRAME_RE.match(line)
+        if m is None or frames is None:
+            continue
+        sym = re.sub(r"\+0x[0-9a-fA-F]+$", "", m.group(1))
+        dso = m.group(2)
+        if sym == "[unknown]":
+            sym = "[unknown] (" + os.path.basename(dso) + ")"
+        frames.append((sym, dso))
+    if frames:
+        samples.append(frames)
+    return samples
+
+def fold_stacks(samples):
+    """
+    Returns a dict mapping 'root;...;leaf' to its sample count.
+    """
+    folded = defaultdict(int)
+    for frames in samples:
+        folded[';'.join(sym for sym, _ in reversed(frames))] += 1
+    return dict(folded)
+
+def hot_functions(samples, lib):
+    """
+    Computes self (leaf) and inclusive sample counts per symbol.
+
+    Returns:
+        list: dicts sorted by descending self samples.
+    """
+    total = len(samples)
+    self_counts = defaultdict(int)
+    incl_counts = defaultdict(int)
+    dsos = {}
+    for frames in samples:
+        if not frames:
+            continue
+        leaf_sym, leaf_dso = frames[0]
+        self_counts[leaf_sym] += 1
+        dsos.setdefault(leaf_sym, leaf_dso)
+        for sym, dso in set(frames):
+            incl_counts[sym] += 1
+            dsos.setdefault(sym, dso)
+    rows = []
+    for sym, incl in incl_counts.items():
+        self_n = self_counts.get(sym, 0)
+        rows.append({
+            'symbol': sym,
+            'category': classify(sym, dsos[sym], lib),
+            'self_samples': self_n,
+            'self_pct': 100.0 * self_n / total if total else 0.0,
+            'inclusive_samples': incl,
+            'inclusive_pct': 100.0 * incl / total if total else 0.0,
+            'dso': os.path.basename(dsos[sym]),
+        })
+    rows.sort(key=lambda r: (-r['self_samples'], -r['inclusive_samples']))
+    return rows
+
+def category_breakdown(samples, lib):
+    """
+    Attributes each sample to the category of its leaf frame.
+
+    Returns:
+        list: dicts with category, samples and percentage, largest first.
+    """
+    total = len(samples)
+    counts = defaultdict(int)
+    for frames in samples:
+        if frames:
+            counts[classify(frames[0][0], frames[0][1], lib)] += 1
+    rows = [{'category': c, 'samples': n, 'pct': 100.0 * n / total if total else 0.0}
+            for c, n in counts.items()]
+    rows.sort(key=lambda r: -r['samples'])
+    return rows
+
+def _build_tree(folded):
+    root = {'count': 0, 'children': {}}
+    for stack, count in folded.items():
+        root['count'] += count
+        node = root
+        for frame in stack.split(';'):
+            node = node['children'].setdefault(frame, {'count': 0, 'children': {}})
+            node['count'] += count
+    return root
+
+def plot_flamegraph(folded, categories, title, out_file, min_frac=0.002):
+    """
+    Draws a flame graph (root at the bottom) colored by frame category.
+
+    Args:
+        folded: dict from fold_stacks().
+        categories: dict mapping symbol to its category.
+        min_frac: frames narrower than this fraction of all samples are skipped.
+    """
+    root = _build_tree(folded)
+    total = root['count']
+    if total == 0:
+        return
+    rects = []
+    def walk(node, x, depth):
+        for frame, child in sorted(node['children'].items()):
+            width = child['count'] / total
+            if width >= min_frac:
+                rects.append((x, depth, width, frame))
+                walk(child, x, depth + 1)
+            x += width
+    walk(root, 0.0, 0)
+    max_depth = max((r[1] for r in rects), default=0) + 1
+
+    fig, ax = plt.subplots(figsize=(16, max(4, 0.25 * max_depth + 1)))
+    for x, depth, width, frame in rects:
+        color = CATEGORY_COLORS.get(categories.get(frame, 'other'))
+        ax.add_patch(Rectangle((x, depth), width, 1, facecolor=color,
+                               edgecolor='white', linewidth=0.3, alpha=0.85))
+        # ~0.006 of the width per character at font size 6
+        max_chars = int(width / 0.006)
+        if max_chars >= 4:
+            label = frame if len(frame) <= max_chars else frame[:max_chars - 2] + '..'
+            ax.text(x + 0.002, depth + 0.5, label, fontsize=6, va='center', clip_on=True)
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, max_depth)
+    ax.set_yticks([])
+    ax.set_xlabel('fraction of samples')
+    ax.set_title(title)
+    handles = [Rectangle((0, 0), 1, 1, facecolor=c) for c in CATEGORY_COLORS.values()]
+    ax.legend(handles, list(CATEGORY_COLORS.keys()), loc='upper right', fontsize=8)
+    fig.tight_layout()
+    fig.savefig(out_file)
+    plt.close(fig)
+
+def _write_csv(path, rows, fields):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({k: (f"{row[k]:.2f}" if isinstance(row[k], float) else row[k]) for k in fields})
+
+def _markdown_table(rows, fields):
+    lines = ["| " + " | ".join(fields) + " |",
+             "|" + "---|" * len(fields)]
+    for row in rows:
+        cells = []
+        for k in fields:
+            v = row[k]
+            v = f"{v:.2f}" if isinstance(v, float) else str(v)
+            cells.append(v.replace("|", "\\|"))
+        lines.append("| " + " | ".join(cells) + " |")
+    return "\n".join(lines)
+
+def profile_point(binary, lib, test, N, out_dir, exec_prefix=(), bench_filter=None,
+                  min_time=5.0, call_graph="dwarf", top=25):
+    """
+    Records one benchmark point under perf and writes the reports into out_dir.
+
+    Args:
+        binary: path to the benchmark executable, e.g. build/benchmark/adept/adept_prod_iter.
+        N: benchmark argument (the number after '/' in the benchmark name).
+        exec_prefix: command prefix for pinning (e.g. numactl ...).
+        bench_filter: --benchmark_filter regex (default: benchmarks ending in '/N').
+        min_time: seconds google benchmark spends on the point.
+        call_graph: value for `perf record --call-graph` (dwarf, fp or lbr).
+        top: number of rows in the hot-function table.
+    """
+    if not os.path.exists(out_dir):
+        os.makedirs(out_dir)
+    if bench_filter is None:
+        bench_filter = "/" + str(N) + "$"
+    bench_exec = [binary, "--benchmark_filter=" + bench_filter,
+                  "--benchmark_min_time=" + str(min_time) + "s"]
+    with tempfile.TemporaryDirectory() as tmp:
+        perf_data = os.path.join(tmp, "perf.data")
+        record = ["perf", "record", "-F", PERF_FREQ, "--call-graph", call_graph,
+                  "-o", perf_data, "--"] + list(exec_prefix) + bench_exec
+        print("Running: ", ' '.join(record))
+        subp.run(record, check=True)
+        script = subp.run(["perf", "script", "-i", perf_data], check=True,
+                          capture_output=True, text=True).stdout
+
+    # the kernel truncates command names to 15 characters
+    samples = parse_perf_script(script, comm=os.path.basename(binary)[:15])
+    if not samples:
+        raise RuntimeError("perf recorded no samples of " + os.path.basename(binary) +
+                           " for --benchmark_filter=" + bench_filter +
+                           " (no matching benchmark, or perf_event_paranoid too strict?)")
+    folded = fold_stacks(samples)
+    with open(os.path.join(out_dir, "stacks.folded"), "w") as f:
+        for stack, count in sorted(folded.items()):
+            f.write(stack + " " + str(count) + "\n")
+
+    hot = hot_functions(samples, lib)
+    cats = category_breakdown(samples, lib)
+    hot_fields = ['symbol', 'category', 'self_samples', 'self_pct',
+                  'inclusive_samples', 'inclusive_pct', 'dso']
+    cat_fields = ['category', 'samples', 'pct']
+    _write_csv(os.path.join(out_dir, "hot_functions.csv"), hot[:top], hot_fields)
+    _write_csv(os.path.join(out_dir, "categories.csv"), cats, cat_fields)
+
+    name = os.path.basename(os.path.normpath(out_dir))
+    plot_flamegraph(folded, {r['symbol']: r['category'] for r in hot},
+                    name + " (" + str(len(samples)) + " samples)",
+                    os.path.join(out_dir, "flamegraph.svg"))
+
+    with open(os.path.join(out_dir, "README.md"), "w") as f:
+        f.write("# " + name + "\n\n")
+        f.write("```\n" + ' '.join(record) + "\n```\n\n")
+        f.write("Samples: " + str(len(samples)) + "\n\n")
+        f.write("## Self time by category\n\n")
+        f.write(_markdown_table(cats, cat_fields) + "\n\n")
+        f.write("## Top " + str(top) + " functions\n\n")
+        f.write(_markdown_table(hot[:top], hot_fields) + "\n")
+    return hot, cats
@@ -0,0 +1,358 @@
+"""
+spool.py — Shared-directory job spool for running the benchmark sweep on several hosts.
+
+The spool is a plain directory (e.g. on NFS) so no service has to run anywhere:
+- jobs/<id>.json           : one (lib, test, N, config) job, written by the coordinator
+- claims/<fp>/<id>.json    : lease of the worker currently running the job on hardware <fp>
+- claims/<fp>/<id>.json.takeover.<attempt> : held while a worker takes over an expired lease
+- attempts/<fp>/<id>.json  : number of times the job was claimed on hardware <fp>
+- results/<fp>/<id>.csv    : google benchmark csv output pushed back by the worker
+- done/<fp>/<id>.json      : job finished on hardware <fp>
+- failed/<fp>/<id>.json    : job failed (or its lease expired too often) on hardware <fp>
+- hosts/<fp>/README.md     : cpu_info report of hardware <fp>
+
+Every hardware fingerprint runs the full job matrix once; all workers sharing a
+fingerprint split it between them. Claims are created with O_EXCL so only one
+worker gets a job. The claim's mtime is the lease heartbeat: a worker touches it
+while the benchmark runs, and claims older than the lease are taken over by the
+next worker, so jobs of crashed workers are retried. Times are always read from
+the shared filesystem so clock skew between hosts does not matter.
+"""
+
+import json
+import os
+import random
+import socket
+import threading
+import time
+
+DEFAULT_SIZES = [2**i for i in range(15)]    # Range(1, 1 << 14) in the drivers
+DEFAULT_LEASE = 600                          # seconds without heartbeat before a job is retried
+MAX_ATTEMPTS = 3
+
+def _path(spool, *parts):
+    return os.path.join(spool, *parts)
+
+def _makedirs(path):
+    if not os.path.exists(path):
+        os.makedirs(path, exist_ok=True)
+
+def _write_json_atomic(path, obj):
+    tmp = path + "." + socket.gethostname() + "." + str(os.getpid()) + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(obj, f, indent=2)
+    os.replace(tmp, path)
+
+def _read_json(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _list_ids(path, ext=None):
+    if not os.path.isdir(path):
+        return []
+    if ext is None:
+        return sorted(os.listdir(path))
+    return sorted(f[:-len(ext)] for f in os.listdir(path) if f.endswith(ext))
+
+def fs_now(spool, worker_id):
+    """
+    Returns the current time of the (shared) filesystem by touching a file.
+    """
+    clock_dir = _path(spool, ".clock")
+    _makedirs(clock_dir)
+    clock = os.path.join(clock_dir, worker_id)
+    with open(clock, "a"):
+        pass
+    os.utime(clock, None)
+    return os.stat(clock).st_mtime
+
+def job_id(lib, test, N, config):
+    return "_".join([test, lib, str(N), config["name"]])
+
+def default_worker_id():
+    return socket.gethostname() + "-" + str(os.getpid())
+
+def submit(spool, libs, tests, sizes, config):
+    """
+    Writes the (lib, test, N, config) job matrix to the spool.
+    Jobs that already exist are left untouched so submitting twice is harmless.
+
+    Args:
+        config: dict with at least 'name' and 'repetitions'.
+
+    Returns:
+        int: number of new jobs.
+    """
+    jobs_dir = _path(spool, "jobs")
+    _makedirs(jobs_dir)
+    n_new = 0
+    for test in tests:
+        for lib in libs:
+            for N in sizes:
+                jid = job_id(lib, test, N, config)
+                path = os.path.join(jobs_dir, jid + ".json")
+                if os.path.exists(path):
+                    continue
+                _write_json_atomic(path, {"id": jid, "lib": lib, "test": test,
+                                          "N": N, "config": config})
+                n_new += 1
+    return n_new
+
+def register_host(spool, fp, report_text):
+    host_dir = _path(spool, "hosts", fp)
+    _makedirs(host_dir)
+    readme = os.path.join(host_dir, "README.md")
+    if not os.path.exists(readme):
+        with open(readme, "w") as f:
+            f.write(report_text)
+
+def _expired_claim(spool, claim, worker_id, lease):
+    """
+    Returns the content of claim if its lease expired, else None.
+    """
+    info = _read_json(claim)
+    try:
+        age = fs_now(spool, worker_id) - os.stat(claim).st_mtime
+    except FileNotFoundError:
+        return None
+    if age < lease:
+        return None
+    # a worker that crashed before writing its claim leaves it empty
+    return info if info is not None else {}
+
+def _try_claim(spool, fp, jid, worker_id, lease):
+    """
+    Attempts to take the lease of a job; returns the attempt number or None.
+    """
+    claim = _path(spool, "claims", fp, jid + ".json")
+    if os.path.exists(claim):
+        old = _expired_claim(spool, claim, worker_id, lease)
+        if old is None:
+            return None
+        # lease expired: one takeover per attempt, so a worker that checked
+        # an older claim cannot take over the one that replaced it
+        takeover = claim + ".takeover." + str(old.get("attempt"))
+        try:
+            os.close(os.open(takeover, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        except FileExistsError:
+            return None
+        try:
+            # re-check now that no other worker can take over this attempt
+            if _expired_claim(spool, claim, worker_id, lease) != old:
+                return None
+            stale = claim + ".expired." + worker_id
+            try:
+                os.rename(claim, stale)
+            except OSError:
+                return None
+            os.remove(stale)
+        finally:
+            os.remove(takeover)
+        print("Lease of", jid, "held by", old.get("worker"), "expired, retrying")
+    try:
+        fd = os.open(claim, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        return None
+    with os.fdopen(fd, "w") as f:
+        # another worker may have finished the job after we listed the open ones
+        if os.path.exists(_path(spool, "done", fp, jid + ".json")) or \
+           os.path.exists(_path(spool, "failed", fp, jid + ".json")):
+            f.close()
+            os.remove(claim)
+            return None
+        # the count lives outside the claim so whoever wins the claim after
+        # an expired lease continues it, whether or not it did the takeover
+        attempts = _path(spool, "attempts", fp, jid + ".json")
+        attempt = (_read_json(attempts) or {}).get("attempt", 0) + 1
+        if attempt > MAX_ATTEMPTS:
+            _write_json_atomic(_path(spool, "failed", fp, jid + ".json"),
+                               {"id": jid, "worker": worker_id, "attempt": attempt - 1,
+                                "error": "lease expired " + str(attempt - 1) + " times"})
+            f.close()
+            os.remove(claim)
+            return None
+        _write_json_atomic(attempts, {"id": jid, "attempt": attempt})
+        json.dump({"id": jid, "worker": worker_id, "attempt": attempt}, f)
+    return attempt
+
+def _owns_claim(claim, worker_id):
+    info = _read_json(claim)
+    return info is not None and info.get("worker") == worker_id
+
+def claim_next(spool, fp, worker_id, lease=DEFAULT_LEASE):
+    """
+    Claims a job that hardware fp has not finished yet.
+
+    Returns:
+        tuple: (job dict or None, number of jobs still open for fp).
+    """
+    for sub in ("claims", "attempts", "done", "failed", "results"):
+        _makedirs(_path(spool, sub, fp))
+    finished = set(_list_ids(_path(spool, "done", fp), ".json")) \
+             | set(_list_ids(_path(spool, "failed", fp), ".json"))
+    open_ids = [jid for jid in _list_ids(_path(spool, "jobs"), ".json") if jid not in finished]
+    # spread workers over the matrix to avoid contending for the same claim
+    random.shuffle(open_ids)
+    for jid in open_ids:
+        attempt = _try_claim(spool, fp, jid, worker_id, lease)
+        if attempt is None:
+            continue
+        job = _read_json(_path(spool, "jobs", jid + ".json"))
+        job["attempt"] = attempt
+        return job, len(open_ids)
+    return None, len(open_ids)
+
+class _Heartbeat:
+    """
+    Touches the claim file every lease/4 seconds while a job runs.
+    """
+    def __init__(self, claim, lease):
+        self.claim = claim
+        self.interval = max(lease / 4.0, 0.1)
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._beat, daemon=True)
+
+    def _beat(self):
+        while not self.stop_event.wait(self.interval):
+            try:
+                os.utime(self.claim, None)
+            except OSError:
+                return
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop_event.set()
+        self.thread.join()
+
+def work(spool, fp, run_job, worker_id=None, lease=DEFAULT_LEASE, poll=10.0):
+    """
+    Claims and runs jobs for hardware fp until none are left.
+
+    Args:
+        run_job: callable(job, out_file) that runs the job and writes its csv
+                 to out_file; it raises on failure.
+        poll: seconds to wait when the remaining jobs are leased by other workers.
+
+    Returns:
+        int: number of jobs this worker completed.
+    """
+    worker_id = worker_id or default_worker_id()
+    n_done = 0
+    while True:
+        job, n_open = claim_next(spool, fp, worker_id, lease)
+        if job is None:
+            if n_open == 0:
+                return n_done
+            # other workers hold the rest; wait in case one of them dies
+            time.sleep(poll)
+            continue
+        jid = job["id"]
+        claim = _path(spool, "claims", fp, jid + ".json")
+        result = _path(spool, "results", fp, jid + ".csv")
+        tmp_result = result + "." + worker_id + ".tmp"
+        print("[" + worker_id + "] running", jid, "(attempt " + str(job["attempt"]) + ")")
+        error = None
+        with _Heartbeat(claim, lease):
+            try:
+                run_job(job, tmp_result)
+            except Exception as e:
+                error = str(e)
+        if not _owns_claim(claim, worker_id):
+            print("[" + worker_id + "] lost lease of", jid, "dropping result")
+            if os.path.exists(tmp_result):
+                os.remove(tmp_result)
+            continue
+        if error is None:
+            os.replace(tmp_result, result)
+            _write_json_atomic(_path(spool, "done", fp, jid + ".json"),
+                               {"id": jid, "worker": worker_id, "attempt": job["attempt"]})
+            n_done += 1
+        else:
+            print("[" + worker_id + "] job", jid, "failed:", error)
+            if os.path.exists(tmp_result):
+                os.remove(tmp_result)
+            _write_json_atomic(_path(spool, "failed", fp, jid + ".json"),
+                               {"id": jid, "worker": worker_id, "attempt": job["attempt"],
+                                "error": error})
+        os.remove(claim)
+
+def status(spool):
+    """
+    Returns:
+        dict: fingerprint -> counts of done, failed, claimed and pending jobs.
+    """
+    n_jobs = len(_list_ids(_path(spool, "jobs"), ".json"))
+    hosts = set(_list_ids(_path(spool, "hosts")))
+    hosts.update(_list_ids(_path(spool, "claims")))
+    out = {}
+    for fp in sorted(hosts):
+        done = len(_list_ids(_path(spool, "done", fp), ".json"))
+        failed = len(_list_ids(_path(spool, "failed", fp), ".json"))
+        claimed = len(_list_ids(_path(spool, "claims", fp), ".json"))
+        out[fp] = {"done": done, "failed": failed, "claimed": claimed,
+                   "pending": n_jobs - done - failed - claimed}
+    return out
+
+def _csv_rows(path):
+    """
+    Splits a google benchmark csv into (preamble + header lines, data lines).
+    """
+    with open(path, "r") as f:
+        lines = f.read().splitlines()
+    for i, line in enumerate(lines):
+        if line.startswith("name,"):
+            return lines[:i + 1], lines[i + 1:]
+    return lines, []
+
+def collect(spool, out_path, stamp):
+    """
+    Merges the per-N results of every hardware fingerprint into the layout
+    written by a local sweep: <out_path>/benchmarks<stamp>_<fp>[_<config>]/<test>_<lib>_multirun.csv
+
+    Returns:
+        list: the directories that were written.
+    """
+    jobs = {jid: _read_json(_path(spool, "jobs", jid + ".json"))
+            for jid in _list_ids(_path(spool, "jobs"), ".json")}
+    written = []
+    for fp in _list_ids(_path(spool, "results")):
+        groups = {}
+        for jid in _list_ids(_path(spool, "done", fp), ".json"):
+            job = jobs.get(jid)
+            if job is None:
+                continue
+            key = (job["config"]["name"], job["test"], job["lib"])
+            groups.setdefault(key, []).append(job)
+        for (config_name, test, lib), group in sorted(groups.items()):
+            folder = "benchmarks" + stamp + "_" + fp
+            if config_name != "default":
+                folder += "_" + config_name
+            run_dir = os.path.join(out_path, folder)
+            if run_dir not in written:
+                _makedirs(run_dir)
+                readme = _path(spool, "hosts", fp, "README.md")
+                if os.path.exists(readme):
+                    with open(readme, "r") as src, open(os.path.join(run_dir, "README.md"), "w") as dst:
+                        dst.write(src.read())
+                written.append(run_dir)
+            merged = []
+            for job in sorted(group, key=lambda j: j["N"]):
+                head, rows = _csv_rows(_path(spool, "results", fp, job["id"] + ".csv"))
+                if not head or not head[-1].startswith("name,"):
+                    # the filter matched no benchmark, the csv has no header
+                    print("No benchmark results for", job["id"], "on", fp)
+                    continue
+                if not merged:
+                    merged.extend(head)
+                merged.extend(rows)
+            if not merged:
+                continue
+            with open(os.path.join(run_dir, test + "_" + lib + "_multirun.csv"), "w") as f:
+                f.write("\n".join(merged) + "\n")
+    return written
@@ -0,0 +1,64 @@
+#include <benchmark/benchmark.h>
+#include <adept.h>
+#include <adept_arrays.h>
+#include <util/check_gradient.hpp>
+
+namespace adb {
+
+// Adept stores the M x N Jacobian column-major, like Eigen::MatrixXd.
+// Its forward mode already propagates ADEPT_MULTIPASS_SIZE tangents per sweep,
+// so there is no separate vector mode.
+template <class F, bool Forward>
+static void BM_adept_jacobian(benchmark::State& state)
+{
+    // Stack can be reused in multiple iterations
+    adept::Stack stack;
+
+    F f;
+    size_t N = state.range(0);
+    size_t M = state.range(1);
+
+    Eigen::VectorXd x(N);
+    f.fill(x, M);
+    Eigen::MatrixXd jac_fx(M, N);
+
+    adept::aVector x_ad(N);
+
+    state.counters["N"] = N;
+    state.counters["M"] = M;
+
+    for (auto _ : state) {
+        for (size_t i = 0; i < N; ++i) {
+            x_ad[i].set_value(x(i));
+        }
+        stack.new_recording();
+        adept::aVector y_ad = f(x_ad);
+        stack.independent(x_ad);
+        stack.dependent(y_ad);
+        if constexpr (Forward) {
+            stack.jacobian_forward(jac_fx.data());
+        } else {
+            stack.jacobian_reverse(jac_fx.data());
+        }
+    }
+
+    // sanity-check that output jacobian is good
+    Eigen::MatrixXd expected(M, N);
+    f.jacobian(x, expected);
+    check_jacobian(jac_fx, expected,
+                   std::string("adept-") + (Forward ? "forward-" : "reverse-") + f.name());
+}
+
+template <class F>
+static void BM_adept_jacobian_forward(benchmark::State& state)
+{
+    BM_adept_jacobian<F, true>(state);
+}
+
+template <class F>
+static void BM_adept_jacobian_reverse(benchmark::State& state)
+{
+    BM_adept_jacobian<F, false>(state);
+}
+
+} // namespace adb
@@ -0,0 +1,30 @@
+#include <adept/jacobian_driver.hpp>
+#include <functor/jacobian_log_sum_exp.hpp>
+
+namespace adb {
+
+struct JacobianLogSumExpFunc: JacobianLogSumExpFuncBase
+{
+    adept::aVector operator()(const adept::aVector& x) const
+    {
+        adept::aVector y(C_.rows());
+        for (int j = 0; j < C_.rows(); ++j) {
+            adept::aReal sum_exp = 0;
+            for (int i = 0; i < x.size(); ++i) {
+                sum_exp += adept::exp(x(i) + C_(j, i));
+            }
+            y(j) = adept::log(sum_exp);
+        }
+        return y;
+    }
+};
+
+BENCHMARK_TEMPLATE(BM_adept_jacobian_forward, JacobianLogSumExpFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+BENCHMARK_TEMPLATE(BM_adept_jacobian_reverse, JacobianLogSumExpFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+} // namespace adb
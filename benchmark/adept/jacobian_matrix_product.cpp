@@ -0,0 +1,30 @@
+#include <adept/jacobian_driver.hpp>
+#include <functor/jacobian_matrix_product.hpp>
+
+namespace adb {
+
+struct JacobianMatrixProductFunc: JacobianMatrixProductFuncBase
+{
+    adept::aVector operator()(const adept::aVector& x) const
+    {
+        adept::aVector y(A_.rows());
+        for (int j = 0; j < A_.rows(); ++j) {
+            adept::aReal y_j = 0;
+            for (int i = 0; i < x.size(); ++i) {
+                y_j += A_(j, i) * x(i);
+            }
+            y(j) = y_j;
+        }
+        return y;
+    }
+};
+
+BENCHMARK_TEMPLATE(BM_adept_jacobian_forward, JacobianMatrixProductFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+BENCHMARK_TEMPLATE(BM_adept_jacobian_reverse, JacobianMatrixProductFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+} // namespace adb
@@ -0,0 +1,29 @@
+#include <adept/jacobian_driver.hpp>
+#include <functor/jacobian_normal_log_pdf.hpp>
+
+namespace adb {
+
+struct JacobianNormalLogPdfFunc: JacobianNormalLogPdfFuncBase
+{
+    adept::aVector operator()(const adept::aVector& x) const
+    {
+        double log_sigma = std::log(sigma_);
+        adept::aVector y(mu_.size());
+        for (int j = 0; j < mu_.size(); ++j) {
+            // same chain as the base functor: no sqrt from norm2
+            adept::aVector z = (x - mu_(j)) / sigma_;
+            y(j) = -0.5 * adept::sum(z * z) - x.size() * log_sigma;
+        }
+        return y;
+    }
+};
+
+BENCHMARK_TEMPLATE(BM_adept_jacobian_forward, JacobianNormalLogPdfFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+BENCHMARK_TEMPLATE(BM_adept_jacobian_reverse, JacobianNormalLogPdfFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+} // namespace adb
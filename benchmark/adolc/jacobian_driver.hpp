@@ -0,0 +1,166 @@
+#include <vector>
+#include <benchmark/benchmark.h>
+#include <adolc/adolc.h>
+#include <util/check_gradient.hpp>
+
+namespace adb {
+
+using adolc_row_mat_t = Eigen::Matrix<double, Eigen::Dynamic, Eigen::Dynamic, Eigen::RowMajor>;
+
+// One tape per thread shared by all Jacobian benchmarks; it is re-traced for each (F, N, M)
+inline short adolc_jacobian_tape()
+{
+    static thread_local bool created = false;
+    static constexpr short tapeId = 0;
+    if (!created) {
+        createNewTape(tapeId);
+        created = true;
+    }
+    return tapeId;
+}
+
+template <class F>
+static void adolc_record(const F& f,
+                         const Eigen::VectorXd& x,
+                         Eigen::VectorXd& fx,
+                         short tapeId)
+{
+    trace_on(tapeId);
+    Eigen::Matrix<adouble, Eigen::Dynamic, 1> x_ad(x.size());
+    for (int i = 0; i < x.size(); ++i) x_ad(i) <<= x(i);
+    Eigen::Matrix<adouble, Eigen::Dynamic, 1> y_ad = f(x_ad);
+    for (int i = 0; i < y_ad.size(); ++i) y_ad(i) >>= fx(i);
+    trace_off();
+}
+
+// Row pointers into a row-major matrix, as expected by the fov_* drivers
+inline std::vector<double*> adolc_rows(adolc_row_mat_t& m)
+{
+    std::vector<double*> rows(m.rows());
+    for (int i = 0; i < m.rows(); ++i) rows[i] = m.row(i).data();
+    return rows;
+}
+
+// One fos_forward sweep per input (Jacobian column)
+template <class F>
+static void BM_adolc_jacobian_forward(benchmark::State& state)
+{
+    F f;
+    const int N = static_cast<int>(state.range(0));
+    const int M = static_cast<int>(state.range(1));
+    Eigen::VectorXd x(N); f.fill(x, M);
+    Eigen::VectorXd fx(M);
+    Eigen::MatrixXd jac_fx(M, N);
+
+    const short tapeId = adolc_jacobian_tape();
+    adolc_record(f, x, fx, tapeId);
+
+    Eigen::VectorXd dx = Eigen::VectorXd::Zero(N);
+    Eigen::VectorXd dy(M);
+    state.counters["N"] = N;
+    state.counters["M"] = M;
+    for (auto _ : state) {
+        for (int j = 0; j < N; ++j) {
+            dx(j) = 1.;
+            fos_forward(tapeId, M, N, /*keep=*/0, x.data(), dx.data(), fx.data(), dy.data());
+            jac_fx.col(j) = dy;
+            dx(j) = 0.;
+        }
+    }
+
+    Eigen::MatrixXd expected(M, N); f.jacobian(x, expected);
+    check_jacobian(jac_fx, expected, "adolc-forward-" + f.name());
+}
+
+// One zos_forward, then one fos_reverse sweep per output (Jacobian row)
+template <class F>
+static void BM_adolc_jacobian_reverse(benchmark::State& state)
+{
+    F f;
+    const int N = static_cast<int>(state.range(0));
+    const int M = static_cast<int>(state.range(1));
+    Eigen::VectorXd x(N); f.fill(x, M);
+    Eigen::VectorXd fx(M);
+    Eigen::MatrixXd jac_fx(M, N);
+
+    const short tapeId = adolc_jacobian_tape();
+    adolc_record(f, x, fx, tapeId);
+
+    Eigen::VectorXd u = Eigen::VectorXd::Zero(M);
+    Eigen::VectorXd row(N);
+    state.counters["N"] = N;
+    state.counters["M"] = M;
+    for (auto _ : state) {
+        zos_forward(tapeId, M, N, /*keep=*/1, x.data(), fx.data());
+        for (int i = 0; i < M; ++i) {
+            u(i) = 1.;
+            fos_reverse(tapeId, M, N, u.data(), row.data());
+            jac_fx.row(i) = row.transpose();
+            u(i) = 0.;
+        }
+    }
+
+    Eigen::MatrixXd expected(M, N); f.jacobian(x, expected);
+    check_jacobian(jac_fx, expected, "adolc-reverse-" + f.name());
+}
+
+// All N tangents in a single fov_forward sweep
+template <class F>
+static void BM_adolc_jacobian_vector_forward(benchmark::State& state)
+{
+    F f;
+    const int N = static_cast<int>(state.range(0));
+    const int M = static_cast<int>(state.range(1));
+    Eigen::VectorXd x(N); f.fill(x, M);
+    Eigen::VectorXd fx(M);
+    Eigen::MatrixXd jac_fx(M, N);
+
+    const short tapeId = adolc_jacobian_tape();
+    adolc_record(f, x, fx, tapeId);
+
+    adolc_row_mat_t seed = adolc_row_mat_t::Identity(N, N);
+    adolc_row_mat_t dy(M, N);
+    auto seed_rows = adolc_rows(seed);
+    auto dy_rows = adolc_rows(dy);
+    state.counters["N"] = N;
+    state.counters["M"] = M;
+    for (auto _ : state) {
+        fov_forward(tapeId, M, N, /*p=*/N, x.data(), seed_rows.data(), fx.data(), dy_rows.data());
+        jac_fx = dy;
+    }
+
+    Eigen::MatrixXd expected(M, N); f.jacobian(x, expected);
+    check_jacobian(jac_fx, expected, "adolc-vector_forward-" + f.name());
+}
+
+// One zos_forward, then all M adjoints in a single fov_reverse sweep
+template <class F>
+static void BM_adolc_jacobian_vector_reverse(benchmark::State& state)
+{
+    F f;
+    const int N = static_cast<int>(state.range(0));
+    const int M = static_cast<int>(state.range(1));
+    Eigen::VectorXd x(N); f.fill(x, M);
+    Eigen::VectorXd fx(M);
+    Eigen::MatrixXd jac_fx(M, N);
+
+    const short tapeId = adolc_jacobian_tape();
+    adolc_record(f, x, fx, tapeId);
+
+    adolc_row_mat_t weights = adolc_row_mat_t::Identity(M, M);
+    adolc_row_mat_t adj(M, N);
+    auto weight_rows = adolc_rows(weights);
+    auto adj_rows = adolc_rows(adj);
+    state.counters["N"] = N;
+    state.counters["M"] = M;
+    for (auto _ : state) {
+        zos_forward(tapeId, M, N, /*keep=*/1, x.data(), fx.data());
+        fov_reverse(tapeId, M, N, /*q=*/M, weight_rows.data(), adj_rows.data());
+        jac_fx = adj;
+    }
+
+    Eigen::MatrixXd expected(M, N); f.jacobian(x, expected);
+    check_jacobian(jac_fx, expected, "adolc-vector_reverse-" + f.name());
+}
+
+} // namespace adb
@@ -0,0 +1,25 @@
+#include <adolc/jacobian_driver.hpp>
+#include <functor/jacobian_normal_log_pdf.hpp>
+
+namespace adb {
+
+struct JacobianNormalLogPdfFunc: JacobianNormalLogPdfFuncBase
+{};
+
+BENCHMARK_TEMPLATE(BM_adolc_jacobian_forward, JacobianNormalLogPdfFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+BENCHMARK_TEMPLATE(BM_adolc_jacobian_reverse, JacobianNormalLogPdfFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+BENCHMARK_TEMPLATE(BM_adolc_jacobian_vector_forward, JacobianNormalLogPdfFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+BENCHMARK_TEMPLATE(BM_adolc_jacobian_vector_reverse, JacobianNormalLogPdfFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+} // namespace adb
@@ -0,0 +1,27 @@
+#include <Eigen/Dense>
+#include <benchmark/benchmark.h>
+
+namespace adb {
+
+// Cost of evaluating the vector-valued function itself
+template <class F>
+static void BM_baseline_jacobian(benchmark::State& state)
+{
+    F f;
+    size_t N = state.range(0);
+    size_t M = state.range(1);
+
+    Eigen::VectorXd x(N);
+    f.fill(x, M);
+    Eigen::VectorXd fx(M);
+
+    state.counters["N"] = N;
+    state.counters["M"] = M;
+
+    for (auto _ : state) {
+        fx = f(x);
+        benchmark::DoNotOptimize(fx.data());
+    }
+}
+
+} // namespace adb
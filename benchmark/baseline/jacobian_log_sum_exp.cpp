@@ -0,0 +1,13 @@
+#include <baseline/jacobian_driver.hpp>
+#include <functor/jacobian_log_sum_exp.hpp>
+
+namespace adb {
+
+struct JacobianLogSumExpFunc: JacobianLogSumExpFuncBase
+{};
+
+BENCHMARK_TEMPLATE(BM_baseline_jacobian, JacobianLogSumExpFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+} // namespace adb
@@ -0,0 +1,13 @@
+#include <baseline/jacobian_driver.hpp>
+#include <functor/jacobian_matrix_product.hpp>
+
+namespace adb {
+
+struct JacobianMatrixProductFunc: JacobianMatrixProductFuncBase
+{};
+
+BENCHMARK_TEMPLATE(BM_baseline_jacobian, JacobianMatrixProductFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+} // namespace adb
@@ -0,0 +1,13 @@
+#include <baseline/jacobian_driver.hpp>
+#include <functor/jacobian_normal_log_pdf.hpp>
+
+namespace adb {
+
+struct JacobianNormalLogPdfFunc: JacobianNormalLogPdfFuncBase
+{};
+
+BENCHMARK_TEMPLATE(BM_baseline_jacobian, JacobianNormalLogPdfFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+} // namespace adb
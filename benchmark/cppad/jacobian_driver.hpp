@@ -0,0 +1,128 @@
+#include <benchmark/benchmark.h>
+#include <cppad/cppad.hpp>
+#include <util/check_gradient.hpp>
+
+namespace adb {
+
+// Tapes f at x once; the benchmarks below only time the sweeps, like BM_cppad
+template <class F>
+static void cppad_record(const F& f,
+                         const Eigen::VectorXd& x,
+                         CppAD::ADFun<double>& g)
+{
+    Eigen::Matrix<CppAD::AD<double>, Eigen::Dynamic, 1> x_ad(x.size());
+    for (int i = 0; i < x.size(); ++i) {
+        x_ad(i) = x(i);
+    }
+    CppAD::Independent(x_ad);
+    Eigen::Matrix<CppAD::AD<double>, Eigen::Dynamic, 1> y_ad = f(x_ad);
+    g.Dependent(x_ad, y_ad);
+}
+
+// One first order forward sweep per input (Jacobian column)
+template <class F>
+static void BM_cppad_jacobian_forward(benchmark::State& state)
+{
+    F f;
+    size_t N = state.range(0);
+    size_t M = state.range(1);
+
+    Eigen::VectorXd x(N);
+    f.fill(x, M);
+    Eigen::VectorXd fx(M);
+    Eigen::MatrixXd jac_fx(M, N);
+
+    CppAD::ADFun<double> g;
+    cppad_record(f, x, g);
+    Eigen::VectorXd dx = Eigen::VectorXd::Zero(N);
+
+    state.counters["N"] = N;
+    state.counters["M"] = M;
+
+    for (auto _ : state) {
+        fx = g.Forward(0, x);
+        for (size_t j = 0; j < N; ++j) {
+            dx(j) = 1.;
+            jac_fx.col(j) = g.Forward(1, dx);
+            dx(j) = 0.;
+        }
+    }
+
+    Eigen::MatrixXd expected(M, N);
+    f.jacobian(x, expected);
+    check_jacobian(jac_fx, expected, "cppad-forward-" + f.name());
+}
+
+// One first order reverse sweep per output (Jacobian row)
+template <class F>
+static void BM_cppad_jacobian_reverse(benchmark::State& state)
+{
+    F f;
+    size_t N = state.range(0);
+    size_t M = state.range(1);
+
+    Eigen::VectorXd x(N);
+    f.fill(x, M);
+    Eigen::VectorXd fx(M);
+    Eigen::MatrixXd jac_fx(M, N);
+
+    CppAD::ADFun<double> g;
+    cppad_record(f, x, g);
+    Eigen::VectorXd w = Eigen::VectorXd::Zero(M);
+
+    state.counters["N"] = N;
+    state.counters["M"] = M;
+
+    for (auto _ : state) {
+        fx = g.Forward(0, x);
+        for (size_t i = 0; i < M; ++i) {
+            w(i) = 1.;
+            jac_fx.row(i) = g.Reverse(1, w).transpose();
+            w(i) = 0.;
+        }
+    }
+
+    Eigen::MatrixXd expected(M, N);
+    f.jacobian(x, expected);
+    check_jacobian(jac_fx, expected, "cppad-reverse-" + f.name());
+}
+
+// All N directions in a single multi-direction forward sweep
+template <class F>
+static void BM_cppad_jacobian_vector_forward(benchmark::State& state)
+{
+    using row_mat_t = Eigen::Matrix<double, Eigen::Dynamic, Eigen::Dynamic, Eigen::RowMajor>;
+
+    F f;
+    size_t N = state.range(0);
+    size_t M = state.range(1);
+
+    Eigen::VectorXd x(N);
+    f.fill(x, M);
+    Eigen::VectorXd fx(M);
+    Eigen::MatrixXd jac_fx(M, N);
+
+    CppAD::ADFun<double> g;
+    cppad_record(f, x, g);
+    // direction ell of input j is stored at dx[N * j + ell]
+    Eigen::VectorXd dx = Eigen::VectorXd::Zero(N * N);
+    for (size_t j = 0; j < N; ++j) {
+        dx(N * j + j) = 1.;
+    }
+    Eigen::VectorXd dy(M * N);
+
+    state.counters["N"] = N;
+    state.counters["M"] = M;
+
+    for (auto _ : state) {
+        fx = g.Forward(0, x);
+        dy = g.Forward(1, N, dx);
+        jac_fx = Eigen::Map<const row_mat_t>(dy.data(), M, N);
+    }
+
+    Eigen::MatrixXd expected(M, N);
+    f.jacobian(x, expected);
+    check_jacobian(jac_fx, expected, "cppad-vector_forward-" + f.name());
+}
+
+} // namespace adb
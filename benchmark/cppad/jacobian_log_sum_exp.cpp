@@ -0,0 +1,21 @@
+#include <cppad/jacobian_driver.hpp>
+#include <functor/jacobian_log_sum_exp.hpp>
+
+namespace adb {
+
+struct JacobianLogSumExpFunc: JacobianLogSumExpFuncBase
+{};
+
+BENCHMARK_TEMPLATE(BM_cppad_jacobian_forward, JacobianLogSumExpFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+BENCHMARK_TEMPLATE(BM_cppad_jacobian_reverse, JacobianLogSumExpFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+BENCHMARK_TEMPLATE(BM_cppad_jacobian_vector_forward, JacobianLogSumExpFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+} // namespace adb
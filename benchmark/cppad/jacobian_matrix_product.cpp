@@ -0,0 +1,21 @@
+#include <cppad/jacobian_driver.hpp>
+#include <functor/jacobian_matrix_product.hpp>
+
+namespace adb {
+
+struct JacobianMatrixProductFunc: JacobianMatrixProductFuncBase
+{};
+
+BENCHMARK_TEMPLATE(BM_cppad_jacobian_forward, JacobianMatrixProductFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+BENCHMARK_TEMPLATE(BM_cppad_jacobian_reverse, JacobianMatrixProductFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+BENCHMARK_TEMPLATE(BM_cppad_jacobian_vector_forward, JacobianMatrixProductFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+} // namespace adb
@@ -0,0 +1,85 @@
+#include <benchmark/benchmark.h>
+#include <fastad>
+#include <util/check_gradient.hpp>
+
+namespace adb {
+
+// One ForwardVar<double> evaluation per input (Jacobian column)
+template <class F>
+void BM_fastad_jacobian_forward(benchmark::State& state)
+{
+    using fvar_t = ad::ForwardVar<double>;
+
+    F f;
+    size_t N = state.range(0);
+    size_t M = state.range(1);
+
+    Eigen::VectorXd x(N);
+    f.fill(x, M);
+    Eigen::MatrixXd jac_fx(M, N);
+
+    Eigen::Matrix<fvar_t, Eigen::Dynamic, 1> x_ad(N);
+    for (size_t n = 0; n < N; ++n) {
+        x_ad(n) = fvar_t(x(n));
+    }
+
+    state.counters["N"] = N;
+    state.counters["M"] = M;
+
+    for (auto _ : state) {
+        for (size_t j = 0; j < N; ++j) {
+            x_ad(j).set_adjoint(1.);
+            Eigen::Matrix<fvar_t, Eigen::Dynamic, 1> y_ad = f(x_ad);
+            for (size_t i = 0; i < M; ++i) {
+                jac_fx(i, j) = y_ad(i).get_adjoint();
+            }
+            x_ad(j).set_adjoint(0.);
+        }
+    }
+
+    // sanity-check that output jacobian is good
+    Eigen::MatrixXd expected(M, N);
+    f.jacobian(x, expected);
+    check_jacobian(jac_fx, expected, "fastad-forward-" + f.name());
+}
+
+// FastAD expressions are scalar-valued: one expression and autodiff per output (Jacobian row)
+template <class F>
+void BM_fastad_jacobian_reverse(benchmark::State& state)
+{
+    F f;
+    size_t N = state.range(0);
+    size_t M = state.range(1);
+
+    Eigen::VectorXd x(N);
+    f.fill(x, M);
+    Eigen::VectorXd fx(M);
+    Eigen::VectorXd row_adj(N);
+    Eigen::MatrixXd jac_fx(M, N);
+
+    state.counters["N"] = N;
+    state.counters["M"] = M;
+
+    for (auto _ : state) {
+        for (size_t i = 0; i < M; ++i) {
+            row_adj.setZero();
+            ad::VarView<double, ad::vec> x_ad(x.data(),
+                                              row_adj.data(),
+                                              x.size());
+            auto expr = f.row(x_ad, i);
+            auto size_pack = expr.bind_cache_size();
+            Eigen::VectorXd val_buf(size_pack(0));
+            Eigen::VectorXd adj_buf(size_pack(1));
+            expr.bind_cache({val_buf.data(), adj_buf.data()});
+            fx(i) = ad::autodiff(expr);
+            jac_fx.row(i) = row_adj.transpose();
+        }
+    }
+
+    // sanity-check that output jacobian is good
+    Eigen::MatrixXd expected(M, N);
+    f.jacobian(x, expected);
+    check_jacobian(jac_fx, expected, "fastad-reverse-" + f.name());
+}
+
+} // namespace adb
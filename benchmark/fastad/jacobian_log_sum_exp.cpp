@@ -0,0 +1,43 @@
+#include <util/counting_iterator.hpp>
+#include <fastad/jacobian_driver.hpp>
+#include <functor/jacobian_log_sum_exp.hpp>
+
+namespace adb {
+
+struct JacobianLogSumExpFunc: JacobianLogSumExpFuncBase
+{
+    // ForwardVar only combines with ForwardVar, so constants are lifted explicitly
+    Eigen::Matrix<ad::ForwardVar<double>, Eigen::Dynamic, 1>
+    operator()(const Eigen::Matrix<ad::ForwardVar<double>, Eigen::Dynamic, 1>& x) const
+    {
+        using fvar_t = ad::ForwardVar<double>;
+        Eigen::Matrix<fvar_t, Eigen::Dynamic, 1> y(C_.rows());
+        for (int j = 0; j < C_.rows(); ++j) {
+            fvar_t sum_exp(0.);
+            for (int i = 0; i < x.size(); ++i) {
+                sum_exp = sum_exp + ad::exp(x(i) + fvar_t(C_(j, i)));
+            }
+            y(j) = ad::log(sum_exp);
+        }
+        return y;
+    }
+
+    // j-th output as a scalar expression for reverse mode
+    template <class T>
+    auto row(ad::VarView<T, ad::vec>& x, size_t j) const
+    {
+        return ad::log(ad::sum(counting_iterator<>(0),
+                               counting_iterator<>(x.size()),
+                               [&, j](size_t i) { return ad::exp(x[i] + C_(j, i)); }));
+    }
+};
+
+BENCHMARK_TEMPLATE(BM_fastad_jacobian_forward, JacobianLogSumExpFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+BENCHMARK_TEMPLATE(BM_fastad_jacobian_reverse, JacobianLogSumExpFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+} // namespace adb
@@ -0,0 +1,43 @@
+#include <util/counting_iterator.hpp>
+#include <fastad/jacobian_driver.hpp>
+#include <functor/jacobian_matrix_product.hpp>
+
+namespace adb {
+
+struct JacobianMatrixProductFunc: JacobianMatrixProductFuncBase
+{
+    // ForwardVar only combines with ForwardVar, so constants are lifted explicitly
+    Eigen::Matrix<ad::ForwardVar<double>, Eigen::Dynamic, 1>
+    operator()(const Eigen::Matrix<ad::ForwardVar<double>, Eigen::Dynamic, 1>& x) const
+    {
+        using fvar_t = ad::ForwardVar<double>;
+        Eigen::Matrix<fvar_t, Eigen::Dynamic, 1> y(A_.rows());
+        for (int j = 0; j < A_.rows(); ++j) {
+            fvar_t y_j(0.);
+            for (int i = 0; i < x.size(); ++i) {
+                y_j = y_j + fvar_t(A_(j, i)) * x(i);
+            }
+            y(j) = y_j;
+        }
+        return y;
+    }
+
+    // j-th output as a scalar expression for reverse mode
+    template <class T>
+    auto row(ad::VarView<T, ad::vec>& x, size_t j) const
+    {
+        return ad::sum(counting_iterator<>(0),
+                       counting_iterator<>(x.size()),
+                       [&, j](size_t i) { return A_(j, i) * x[i]; });
+    }
+};
+
+BENCHMARK_TEMPLATE(BM_fastad_jacobian_forward, JacobianMatrixProductFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+BENCHMARK_TEMPLATE(BM_fastad_jacobian_reverse, JacobianMatrixProductFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+} // namespace adb
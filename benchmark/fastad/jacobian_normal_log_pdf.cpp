@@ -0,0 +1,46 @@
+#include <util/counting_iterator.hpp>
+#include <fastad/jacobian_driver.hpp>
+#include <functor/jacobian_normal_log_pdf.hpp>
+
+namespace adb {
+
+struct JacobianNormalLogPdfFunc: JacobianNormalLogPdfFuncBase
+{
+    // ForwardVar only combines with ForwardVar, so constants are lifted explicitly
+    Eigen::Matrix<ad::ForwardVar<double>, Eigen::Dynamic, 1>
+    operator()(const Eigen::Matrix<ad::ForwardVar<double>, Eigen::Dynamic, 1>& x) const
+    {
+        using fvar_t = ad::ForwardVar<double>;
+        fvar_t inv_sigma(1. / sigma_);
+        fvar_t half(0.5);
+        fvar_t log_norm(x.size() * std::log(sigma_));
+        Eigen::Matrix<fvar_t, Eigen::Dynamic, 1> y(mu_.size());
+        for (int j = 0; j < mu_.size(); ++j) {
+            fvar_t mu(mu_(j));
+            fvar_t z_sq(0.);
+            for (int i = 0; i < x.size(); ++i) {
+                fvar_t z = (x(i) - mu) * inv_sigma;
+                z_sq = z_sq + z * z;
+            }
+            y(j) = fvar_t(0.) - half * z_sq - log_norm;
+        }
+        return y;
+    }
+
+    // j-th output as a scalar expression for reverse mode
+    template <class T>
+    auto row(ad::VarView<T, ad::vec>& x, size_t j) const
+    {
+        return ad::normal_adj_log_pdf(x, mu_(j), sigma_);
+    }
+};
+
+BENCHMARK_TEMPLATE(BM_fastad_jacobian_forward, JacobianNormalLogPdfFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+BENCHMARK_TEMPLATE(BM_fastad_jacobian_reverse, JacobianNormalLogPdfFunc)
+    -> ArgsProduct({benchmark::CreateRange(1, 1 << 8, 4), benchmark::CreateRange(1, 1 << 8, 4)})
+    -> ArgNames({"N", "M"});
+
+} // namespace adb
@@ -0,0 +1,46 @@
+#pragma once
+#include <string>
+#include <functor/functor_base.hpp>
+
+namespace adb {
+
+// Vector-valued variant of log_sum_exp: y_j = log(sum_i exp(x_i + C_ji))
+struct JacobianLogSumExpFuncBase: FuncBase
+{
+    template <class T>
+    Eigen::Matrix<T, Eigen::Dynamic, 1> operator()(const Eigen::Matrix<T, Eigen::Dynamic, 1>& x) const
+    {
+        using std::exp;
+        using std::log;
+        Eigen::Matrix<T, Eigen::Dynamic, 1> y(C_.rows());
+        for (int j = 0; j < C_.rows(); ++j) {
+            T sum_exp = 0;
+            for (int i = 0; i < x.size(); ++i) {
+                sum_exp += exp(x(i) + C_(j, i));
+            }
+            y(j) = log(sum_exp);
+        }
+        return y;
+    }
+
+    void jacobian(const Eigen::VectorXd& x,
+                  Eigen::MatrixXd& jac) const
+    {
+        jac = (C_.rowwise() + x.transpose()).array().exp().matrix();
+        jac.array().colwise() /= jac.rowwise().sum().array();
+    }
+
+    std::string name() const { return "jacobian_log_sum_exp"; }
+
+    // x holds the N inputs, M is the number of outputs
+    void fill(Eigen::VectorXd& x, size_t M)
+    {
+        FuncBase::fill(x);
+        C_ = Eigen::MatrixXd::Random(M, x.size());
+    }
+
+protected:
+    Eigen::MatrixXd C_;
+};
+
+} // namespace adb
@@ -0,0 +1,43 @@
+#pragma once
+#include <string>
+#include <functor/functor_base.hpp>
+
+namespace adb {
+
+// Vector-valued variant of matrix_product: y = A x with A in R^{M x N}
+struct JacobianMatrixProductFuncBase: FuncBase
+{
+    template <class T>
+    Eigen::Matrix<T, Eigen::Dynamic, 1> operator()(const Eigen::Matrix<T, Eigen::Dynamic, 1>& x) const
+    {
+        Eigen::Matrix<T, Eigen::Dynamic, 1> y(A_.rows());
+        for (int j = 0; j < A_.rows(); ++j) {
+            T y_j = 0;
+            for (int i = 0; i < x.size(); ++i) {
+                y_j += A_(j, i) * x(i);
+            }
+            y(j) = y_j;
+        }
+        return y;
+    }
+
+    void jacobian(const Eigen::VectorXd& x,
+                  Eigen::MatrixXd& jac) const
+    {
+        jac = A_;
+    }
+
+    std::string name() const { return "jacobian_matrix_product"; }
+
+    // x holds the N inputs, M is the number of outputs
+    void fill(Eigen::VectorXd& x, size_t M)
+    {
+        FuncBase::fill(x);
+        A_ = Eigen::MatrixXd::Random(M, x.size());
+    }
+
+protected:
+    Eigen::MatrixXd A_;
+};
+
+} // namespace adb
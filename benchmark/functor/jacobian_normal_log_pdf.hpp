@@ -0,0 +1,48 @@
+#pragma once
+#include <cmath>
+#include <string>
+#include <functor/functor_base.hpp>
+
+namespace adb {
+
+// Vector-valued variant of normal_log_pdf: y_j = log N(x | mu_j, sigma) for M locations mu_j
+struct JacobianNormalLogPdfFuncBase: FuncBase
+{
+    template <class T>
+    Eigen::Matrix<T, Eigen::Dynamic, 1> operator()(const Eigen::Matrix<T, Eigen::Dynamic, 1>& x) const
+    {
+        Eigen::Matrix<T, Eigen::Dynamic, 1> y(mu_.size());
+        for (int j = 0; j < mu_.size(); ++j) {
+            T z_sq = 0;
+            for (int i = 0; i < x.size(); ++i) {
+                T z = (x(i) - mu_(j)) / sigma_;
+                z_sq += z * z;
+            }
+            y(j) = -0.5 * z_sq - x.size() * std::log(sigma_);
+        }
+        return y;
+    }
+
+    void jacobian(const Eigen::VectorXd& x,
+                  Eigen::MatrixXd& jac) const
+    {
+        jac = (-x.transpose()).replicate(mu_.size(), 1);
+        jac.colwise() += mu_;
+        jac /= sigma_ * sigma_;
+    }
+
+    std::string name() const { return "jacobian_normal_log_pdf"; }
+
+    // x holds the N inputs, M is the number of outputs
+    void fill(Eigen::VectorXd& x, size_t M)
+    {
+        FuncBase::fill(x);
+        mu_ = Eigen::VectorXd::Random(M);
+    }
+
+protected:
+    Eigen::VectorXd mu_;
+    double sigma_ = 1.37;
+};
+
+} // namespace adb
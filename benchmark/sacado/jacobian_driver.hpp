@@ -0,0 +1,121 @@
+#include <benchmark/benchmark.h>
+#include <Sacado.hpp>
+#include <util/check_gradient.hpp>
+
+namespace adb {
+
+// One SFad<double, 1> evaluation per input (Jacobian column)
+template <class F>
+static void BM_sacado_jacobian_forward(benchmark::State& state)
+{
+    using fad_t = Sacado::Fad::SFad<double, 1>;
+
+    F f;
+    size_t N = state.range(0);
+    size_t M = state.range(1);
+
+    Eigen::VectorXd x(N);
+    f.fill(x, M);
+    Eigen::MatrixXd jac_fx(M, N);
+
+    Eigen::Matrix<fad_t, Eigen::Dynamic, 1> x_ad(N);
+    for (size_t n = 0; n < N; ++n) {
+        x_ad(n) = fad_t(1, x(n));
+    }
+
+    state.counters["N"] = N;
+    state.counters["M"] = M;
+
+    for (auto _ : state) {
+        for (size_t j = 0; j < N; ++j) {
+            x_ad(j).fastAccessDx(0) = 1.;
+            Eigen::Matrix<fad_t, Eigen::Dynamic, 1> y_ad = f(x_ad);
+            for (size_t i = 0; i < M; ++i) {
+                jac_fx(i, j) = y_ad(i).dx(0);
+            }
+            x_ad(j).fastAccessDx(0) = 0.;
+        }
+    }
+
+    // sanity-check that output jacobian is good
+    Eigen::MatrixXd expected(M, N);
+    f.jacobian(x, expected);
+    check_jacobian(jac_fx, expected, "sacado-forward-" + f.name());
+}
+
+// One DFad<double> evaluation carrying all N tangents
+template <class F>
+static void BM_sacado_jacobian_vector_forward(benchmark::State& state)
+{
+    using fad_t = Sacado::Fad::DFad<double>;
+
+    F f;
+    size_t N = state.range(0);
+    size_t M = state.range(1);
+
+    Eigen::VectorXd x(N);
+    f.fill(x, M);
+    Eigen::MatrixXd jac_fx(M, N);
+
+    Eigen::Matrix<fad_t, Eigen::Dynamic, 1> x_ad(N);
+
+    state.counters["N"] = N;
+    state.counters["M"] = M;
+
+    for (auto _ : state) {
+        for (size_t n = 0; n < N; ++n) {
+            x_ad(n) = fad_t(N, n, x(n));
+        }
+        Eigen::Matrix<fad_t, Eigen::Dynamic, 1> y_ad = f(x_ad);
+        for (size_t i = 0; i < M; ++i) {
+            for (size_t j = 0; j < N; ++j) {
+                jac_fx(i, j) = y_ad(i).dx(j);
+            }
+        }
+    }
+
+    // sanity-check that output jacobian is good
+    Eigen::MatrixXd expected(M, N);
+    f.jacobian(x, expected);
+    check_jacobian(jac_fx, expected, "sacado-vector_forward-" + f.name());
+}
+
+// Records once with Rad, then one reverse sweep per output (Jacobian row)
+template <class F>
+static void BM_sacado_jacobian_reverse(benchmark::State& state)
+{
+    using rad_t = Sacado::Rad::ADvar<double>;
+
+    F f;
+    size_t N = state.range(0);
+    size_t M = state.range(1);
+
+    Eigen::VectorXd x(N);
+    f.fill(x, M);
+    Eigen::MatrixXd jac_fx(M, N);
+
+    Eigen::Matrix<rad_t, Eigen::Dynamic, 1> x_ad(N);
+
+    state.counters["N"] = N;
+    state.counters["M"] = M;
+
+    for (auto _ : state) {
+        for (size_t n = 0; n < N; ++n) {
+            x_ad(n) = x[n];
+        }
+        Eigen::Matrix<rad_t, Eigen::Dynamic, 1> y_ad = f(x_ad);
+        for (size_t i = 0; i < M; ++i) {
+            rad_t::Outvar_Gradcomp(y_ad(i));
+            for (size_t n = 0; n < N; ++n) {
+                jac_fx(i, n) = x_ad(n).adj();
+            }
+        }
+    }
+
+    // sanity-check that output jacobian is good
+    Eigen::MatrixXd expected(M, N);
+    f.jacobian(x, expected);
+    check_jacobian(jac_fx, expected, "sacado-reverse-" + f.name());
+}
+
+} // namespace adb
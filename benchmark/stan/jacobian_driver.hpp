@@ -0,0 +1,73 @@
+#include <benchmark/benchmark.h>
+#include <stan/math.hpp>
+#include <util/check_gradient.hpp>
+
+namespace adb {
+
+// One fvar<double> evaluation per input (Jacobian column)
+template <class F>
+static void BM_stan_jacobian_forward(benchmark::State& state)
+{
+    using fvar_t = stan::math::fvar<double>;
+
+    F f;
+    size_t N = state.range(0);
+    size_t M = state.range(1);
+
+    Eigen::VectorXd x(N);
+    f.fill(x, M);
+    Eigen::MatrixXd jac_fx(M, N);
+
+    Eigen::Matrix<fvar_t, Eigen::Dynamic, 1> x_fvar(N);
+    for (size_t n = 0; n < N; ++n) {
+        x_fvar(n) = fvar_t(x(n), 0.);
+    }
+
+    state.counters["N"] = N;
+    state.counters["M"] = M;
+
+    for (auto _ : state) {
+        for (size_t j = 0; j < N; ++j) {
+            x_fvar(j).d_ = 1.;
+            Eigen::Matrix<fvar_t, Eigen::Dynamic, 1> y_fvar = f(x_fvar);
+            for (size_t i = 0; i < M; ++i) {
+                jac_fx(i, j) = y_fvar(i).d_;
+            }
+            x_fvar(j).d_ = 0.;
+        }
+    }
+
+    // sanity-check that output jacobian is good
+    Eigen::MatrixXd expected(M, N);
+    f.jacobian(x, expected);
+    check_jacobian(jac_fx, expected, "stan-forward-" + f.name());
+}
+
+// stan::math::jacobian records once and runs one reverse sweep per output
+template <class F>
+static void BM_stan_jacobian_reverse(benchmark::State& state)
+{
+    F f;
+    size_t N = state.range(0);
+    size_t M = state.range(1);
+
+    Eigen::VectorXd x(N);
+    f.fill(x, M);
+    Eigen::VectorXd fx(M);
+    Eigen::MatrixXd jac_fx(M, N);
+
+    state.counters["N"] = N;
+    state.counters["M"] = M;
+
+    for (auto _ : state) {
+        stan::math::jacobian(f, x, fx, jac_fx);
+        stan::math::recover_memory();
+    }
+
+    // sanity-check that output jacobian is good
+    Eigen::MatrixXd expected(M, N);
+    f.jacobian(x, expected);
+    check_jacobian(jac_fx, expected, "stan-reverse-" + f.name());
+}
+
+} // namespace adb
@@ -1,3 +1,4 @@
+#pragma once
 #include <Eigen/Dense>
 #include <iostream>
 
@@ -20,4 +21,14 @@ inline void check_gradient(const Eigen::VectorXd& actual,
     }
 }
 
+inline void check_jacobian(const Eigen::MatrixXd& actual,
+                           const Eigen::MatrixXd& expected,
+                           const std::string& name)
+{
+    // column-major flattening, so the reported index is i + j * M
+    check_gradient(Eigen::Map<const Eigen::VectorXd>(actual.data(), actual.size()),
+                   Eigen::Map<const Eigen::VectorXd>(expected.data(), expected.size()),
+                   name);
+}
+
 } // namespace adb